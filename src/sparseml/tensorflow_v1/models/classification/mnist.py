@@ -22,6 +22,8 @@ __all__ = ["mnist_net"]
 
 
 BASE_NAME_SCOPE = "mnist_net"
+# (in_chan, out_chan, stride) for each conv in the blocks scope
+_CONV_BLOCKS = [(1, 16, 1), (16, 32, 2), (32, 64, 1), (64, 128, 2)]
 
 
 @ModelRegistry.register(
@@ -38,7 +40,11 @@ BASE_NAME_SCOPE = "mnist_net"
     tl_ignore_tens=[],
 )
 def mnist_net(
-    inputs: tf_compat.Tensor, num_classes: int = 10, act: str = None
+    inputs: tf_compat.Tensor,
+    num_classes: int = 10,
+    act: str = None,
+    data_format: str = "channels_last",
+    quantize: bool = False,
 ) -> tf_compat.Tensor:
     """
     A simple convolutional model created for the MNIST dataset
@@ -47,6 +53,12 @@ def mnist_net(
     :param num_classes: the number of classes to create the final layer for
     :param act: the final activation to use in the model,
         supported: [None, relu, sigmoid, softmax]
+    :param data_format: the layout of the inputs tensor, supported:
+        [channels_last, channels_first]. channels_first avoids the layout
+        transposes otherwise inserted for older cuDNN builds, but requires a GPU
+        since the default TensorFlow CPU kernels only support channels_last convs
+    :param quantize: True to add fake int8 quantization to the conv layers
+        for quantization aware training, False otherwise
     :return: the logits output from the created network
     """
     if act not in [None, "sigmoid", "softmax"]:
@@ -54,50 +66,29 @@ def mnist_net(
 
     with tf_compat.variable_scope(BASE_NAME_SCOPE, reuse=tf_compat.AUTO_REUSE):
         with tf_compat.variable_scope("blocks", reuse=tf_compat.AUTO_REUSE):
-            x_tens = conv2d(
-                name="conv0",
-                x_tens=inputs,
-                in_chan=1,
-                out_chan=16,
-                kernel=5,
-                stride=1,
-                padding="SAME",
-                act="relu",
-            )
-            x_tens = conv2d(
-                name="conv1",
-                x_tens=x_tens,
-                in_chan=16,
-                out_chan=32,
-                kernel=5,
-                stride=2,
-                padding="SAME",
-                act="relu",
-            )
-            x_tens = conv2d(
-                name="conv2",
-                x_tens=x_tens,
-                in_chan=32,
-                out_chan=64,
-                kernel=5,
-                stride=1,
-                padding="SAME",
-                act="relu",
-            )
-            x_tens = conv2d(
-                name="conv3",
-                x_tens=x_tens,
-                in_chan=64,
-                out_chan=128,
-                kernel=5,
-                stride=2,
-                padding="SAME",
-                act="relu",
-            )
+            x_tens = inputs
+
+            for index, (in_chan, out_chan, stride) in enumerate(_CONV_BLOCKS):
+                x_tens = conv2d(
+                    name="conv{}".format(index),
+                    x_tens=x_tens,
+                    in_chan=in_chan,
+                    out_chan=out_chan,
+                    kernel=5,
+                    stride=stride,
+                    padding="SAME",
+                    act="relu",
+                    data_format=data_format,
+                    quantize=quantize,
+                )
 
         with tf_compat.variable_scope("classifier"):
-            x_tens = tf_compat.reduce_mean(x_tens, axis=[1, 2])
-            x_tens = tf_compat.reshape(x_tens, [-1, 128])
+            # reducing without keepdims already gives [batch, 128] for either layout
+            x_tens = tf_compat.reduce_mean(
+                x_tens,
+                axis=[1, 2] if data_format == "channels_last" else [2, 3],
+                keepdims=False,
+            )
             x_tens = fc(name="fc", x_tens=x_tens, in_chan=128, out_chan=num_classes)
 
         with tf_compat.variable_scope("logits"):
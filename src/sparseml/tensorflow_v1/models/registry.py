@@ -20,6 +20,7 @@ import re
 from typing import Any, Callable, Dict, List, Optional, Union
 
 from sparseml.tensorflow_v1.models.estimator import EstimatorModelFn
+from sparseml.tensorflow_v1.nn import QUANT_RANGE_VARIABLES
 from sparseml.tensorflow_v1.utils import tf_compat
 from sparseml.utils import TENSORFLOW_V1_FRAMEWORK, parse_optimization_str
 from sparsezoo import Zoo
@@ -269,6 +270,8 @@ class ModelRegistry(object):
         """
         Get a tf compat saver that contains only the variables for the desired
         architecture specified by key.
+        Quantization range variables (QUANT_RANGE_VARIABLES) are not included
+        since they are only created for quantization aware training.
         Note, the architecture must have been created in the current graph already
         to work.
 
@@ -285,10 +288,15 @@ class ModelRegistry(object):
                 )
             )
         base_name = ModelRegistry._ATTRIBUTES[key].base_name_scope
+        # quantization ranges are created for QAT and never stored in the
+        # pretrained checkpoints, so leave them out of the restore
+        quant_range_names = [
+            var.name for var in tf_compat.get_collection(QUANT_RANGE_VARIABLES)
+        ]
         saver_vars = [
             var
             for var in tf_compat.get_collection(tf_compat.GraphKeys.TRAINABLE_VARIABLES)
-            if base_name in var.name
+            if base_name in var.name and var.name not in quant_range_names
         ]
         saver_vars.extend(
             [
@@ -25,11 +25,21 @@ __all__ = [
     "dense_block",
     "fc",
     "conv2d",
+    "QUANT_RANGE_VARIABLES",
 ]
 
 
 BN_MOMENTUM = 0.9
 BN_EPSILON = 1e-5
+# graph collection for the learned quantization range variables, kept separate
+# so they can be left out when restoring non quantized checkpoints
+QUANT_RANGE_VARIABLES = "quant_range_variables"
+QUANT_ACT_RANGES = {
+    "relu": (0.0, 6.0),
+    "relu6": (0.0, 6.0),
+    "sigmoid": (0.0, 1.0),
+    "softmax": (0.0, 1.0),
+}
 
 
 def activation(x_tens: tf_compat.Tensor, act: Union[None, str], name: str = "act"):
@@ -464,6 +474,8 @@ def conv2d(
     stride: int,
     padding: str,
     act: Union[None, str] = None,
+    data_format: str = "channels_last",
+    quantize: bool = False,
 ):
     """
     Create a convolutional layer with the proper ops and variables.
@@ -477,8 +489,16 @@ def conv2d(
     :param padding: the padding to apply to the convolution
     :param act: an activation type to add into the layer, supported:
         [None, relu, sigmoid, softmax]
+    :param data_format: Either channels_last or channels_first
+    :param quantize: True to simulate int8 quantization of the weight and the
+        output for quantization aware training, False otherwise.
+        The output range starts from the expected range for act,
+        [-6, 6] if act is None
     :return: the created layer
     """
+    if data_format not in ["channels_last", "channels_first"]:
+        raise ValueError("unsupported data_format given of {}".format(data_format))
+
     with tf_compat.variable_scope(name, reuse=tf_compat.AUTO_REUSE):
         weight = tf_compat.get_variable(
             "weight",
@@ -493,10 +513,63 @@ def conv2d(
             dtype=tf_compat.float32,
         )
 
+        if quantize:
+            # the range tracks the weight without sending fake quant gradients
+            # back into the current min and max weights
+            weight = tf_compat.fake_quant_with_min_max_vars(
+                weight,
+                tf_compat.stop_gradient(tf_compat.reduce_min(weight)),
+                tf_compat.stop_gradient(tf_compat.reduce_max(weight)),
+                num_bits=8,
+                name="weight_quant",
+            )
+
+        if data_format == "channels_last":
+            layout = "NHWC"
+            strides = [1, stride, stride, 1]
+        else:
+            layout = "NCHW"
+            strides = [1, 1, stride, stride]
+
         x_tens = tf_compat.nn.conv2d(
-            x_tens, weight, strides=[1, stride, stride, 1], padding=padding, name="conv"
+            x_tens,
+            weight,
+            strides=strides,
+            padding=padding,
+            data_format=layout,
+            name="conv",
+        )
+        x_tens = tf_compat.nn.bias_add(
+            x_tens, bias, data_format=layout, name="bias_add"
         )
-        x_tens = tf_compat.nn.bias_add(x_tens, bias, name="bias_add")
         x_tens = activation(x_tens, act)
 
+        if quantize:
+            # output range is learned through the fake quant gradients,
+            # starting from the expected range of the activation
+            range_min, range_max = QUANT_ACT_RANGES.get(act, (-6.0, 6.0))
+            act_min = tf_compat.get_variable(
+                "act_min",
+                shape=[],
+                initializer=tf_compat.constant_initializer(range_min),
+                dtype=tf_compat.float32,
+                collections=[
+                    tf_compat.GraphKeys.GLOBAL_VARIABLES,
+                    QUANT_RANGE_VARIABLES,
+                ],
+            )
+            act_max = tf_compat.get_variable(
+                "act_max",
+                shape=[],
+                initializer=tf_compat.constant_initializer(range_max),
+                dtype=tf_compat.float32,
+                collections=[
+                    tf_compat.GraphKeys.GLOBAL_VARIABLES,
+                    QUANT_RANGE_VARIABLES,
+                ],
+            )
+            x_tens = tf_compat.fake_quant_with_min_max_vars(
+                x_tens, act_min, act_max, num_bits=8, name="act_quant"
+            )
+
     return x_tens
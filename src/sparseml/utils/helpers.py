@@ -17,8 +17,8 @@ General utility helper functions.
 Common functions for interfacing with python primitives and directories/files.
 """
 
-import errno
 import fnmatch
+import functools
 import logging
 import os
 import re
@@ -34,6 +34,12 @@ from sparsezoo.objects import Recipe
 from sparsezoo.utils import load_numpy_list
 
 
+try:
+    from math import cbrt  # python>=3.11
+except ImportError:
+    cbrt = None
+
+
 __all__ = [
     "ALL_TOKEN",
     "ALL_PRUNABLE_TOKEN",
@@ -76,21 +82,44 @@ _LOGGER = logging.getLogger(__name__)
 ##############################
 
 
+# concrete types checked before falling back on the much slower Iterable ABC check
+_NESTED_TYPES = (list, tuple, set, frozenset)
+_FLAT_TYPES = (str, bytes, int, float)
+
+
 def flatten_iterable(li: Iterable):
     """
     :param li: a possibly nested iterable of items to be flattened
     :return: a flattened version of the list where all elements are in a single list
              flattened in a depth first pattern
     """
+    flattened = []
+    # walk with an explicit stack of iterators rather than recursive generators
+    stack = [iter(li)]
+    # bind the globals used per element as locals for faster lookups in the loop
+    is_inst = isinstance
+    nested_types = _NESTED_TYPES
+    flat_types = _FLAT_TYPES
+    iterable = Iterable
+    append = flattened.append
+
+    while stack:
+        for el in stack[-1]:
+            if is_inst(el, nested_types) or (
+                not is_inst(el, flat_types) and is_inst(el, iterable)
+            ):
+                stack.append(iter(el))
+                break
+
+            append(el)
+        else:
+            stack.pop()
+
+    return flattened
 
-    def _flatten_gen(_li):
-        for el in _li:
-            if isinstance(el, Iterable) and not isinstance(el, (str, bytes)):
-                yield from _flatten_gen(el)
-            else:
-                yield el
 
-    return list(_flatten_gen(li))
+_TRUE_STRS = {"true", "t", "1", "yes", "y", "on"}
+_FALSE_STRS = {"false", "f", "0", "no", "n", "off", ""}
 
 
 def convert_to_bool(val: Any):
@@ -100,11 +129,18 @@ def convert_to_bool(val: Any):
     :return: the boolean representation of the value, if it can't be determined,
         falls back on returning True
     """
-    return (
-        bool(val)
-        if not isinstance(val, str)
-        else bool(val) and "f" not in val.lower() and "0" not in val.lower()
-    )
+    if not isinstance(val, str):
+        return bool(val)
+
+    val = val.strip().lower()
+
+    if val in _TRUE_STRS:
+        return True
+
+    if val in _FALSE_STRS:
+        return False
+
+    return bool(val)
 
 
 def validate_str_iterable(
@@ -138,7 +174,8 @@ def bucket_iterable(
     edge_percent: float = 0.05,
     sort_highest: bool = True,
     sort_key: Callable[[Any], Any] = None,
-) -> List[Tuple[int, Any]]:
+    as_array: bool = False,
+) -> Union[List[Tuple[int, Any]], Tuple[List[Any], numpy.ndarray]]:
     """
     Bucket iterable into subarray consisting of the first top percentage
     followed by the rest of the iterable sliced into equal sliced groups.
@@ -153,29 +190,80 @@ def bucket_iterable(
         and will create buckets in descending order.
         False to sort so lowest is first and create buckets in ascending order.
     :param sort_key: The sort_key, if any, to use for sorting the iterable
-        after converting it to a list
-    :return: a list of each value mapped to the bucket it was sorted into
+        after converting it to a list. It is called only once per value,
+        so expensive keys don't need to be cached by the caller
+    :param as_array: True to return the sorted values along with an int32 numpy
+        array of the bucket each value was sorted into, False to return a list
+        of (bucket, value) tuples
+    :return: a list of each value mapped to the bucket it was sorted into,
+        or a tuple of the sorted values and their buckets if as_array
     """
 
     val_list = [v for v in val]
     val_list.sort(key=sort_key, reverse=sort_highest)
-    bucketed_values = []
-    edge_count = round(edge_percent * len(val_list))
-
-    if edge_count > 0:
-        bucketed_values.extend([(-1, val) for val in val_list[:edge_count]])
-        val_list = val_list[edge_count:]
+    edge_count = min(max(round(edge_percent * len(val_list)), 0), len(val_list))
+    bucket_counts = [edge_count]
 
-    buckets_count = round(len(val_list) / float(num_buckets))
+    # size the buckets by index rather than repeatedly slicing off the tail
+    buckets_count = round((len(val_list) - edge_count) / float(num_buckets))
+    start = edge_count
 
     for bucket in range(num_buckets):
-        add_vals = val_list[:buckets_count] if bucket < num_buckets - 1 else val_list
-        val_list = val_list[buckets_count:] if bucket < num_buckets - 1 else []
-        bucketed_values.extend([(bucket, val) for val in add_vals])
+        end = (
+            min(start + buckets_count, len(val_list))
+            if bucket < num_buckets - 1
+            else len(val_list)
+        )
+        end = max(end, start)
+        bucket_counts.append(end - start)
+        start = end
+
+    if as_array:
+        bucket_ids = numpy.repeat(
+            numpy.arange(-1, num_buckets, dtype=numpy.int32), bucket_counts
+        )
+
+        return val_list, bucket_ids
+
+    bucketed_values = []
+    start = 0
+
+    for bucket, count in enumerate(bucket_counts, start=-1):
+        bucketed_values.extend(
+            [(bucket, val) for val in val_list[start : start + count]]
+        )
+        start += count
 
     return bucketed_values
 
 
+_ONE_THIRD = 1 / 3
+
+
+def _interpolate_linear(x_per: float) -> float:
+    return x_per
+
+
+def _interpolate_cubic(x_per: float) -> float:
+    # https://www.wolframalpha.com/input/?i=1-(1-x)%5E3+from+0+to+1
+    inv_per = 1 - x_per
+
+    return 1 - inv_per * inv_per * inv_per
+
+
+def _interpolate_inverse_cubic(x_per: float) -> float:
+    # https://www.wolframalpha.com/input/?i=1-(1-x)%5E(1%2F3)+from+0+to+1
+    if cbrt is not None:
+        return 1 - cbrt(1 - x_per)
+
+    return 1 - (1 - x_per) ** _ONE_THIRD
+
+
+_INTERPOLATION_KERNELS = {
+    "linear": _interpolate_linear,
+    "cubic": _interpolate_cubic,
+    "inverse_cubic": _interpolate_inverse_cubic,
+}
 INTERPOLATION_FUNCS = ["linear", "cubic", "inverse_cubic"]
 
 
@@ -196,7 +284,9 @@ def interpolate(
     :return: the interpolated value projecting x into y for the given
         interpolation function
     """
-    if inter_func not in INTERPOLATION_FUNCS:
+    kernel = _INTERPOLATION_KERNELS.get(inter_func)
+
+    if kernel is None:
         raise ValueError(
             "unsupported inter_func given of {} must be one of {}".format(
                 inter_func, INTERPOLATION_FUNCS
@@ -207,19 +297,15 @@ def interpolate(
     # (0,0)-(1,1) space
     x_per = (x_cur - x0) / (x1 - x0)
 
+    # cap values outside of [x0, x1]
+    if x_per <= 0.0:
+        return y0
+
+    if x_per >= 1.0:
+        return y1
+
     # map x to y using the desired function in (0,0)-(1,1) space
-    if inter_func == "linear":
-        y_per = x_per
-    elif inter_func == "cubic":
-        # https://www.wolframalpha.com/input/?i=1-(1-x)%5E3+from+0+to+1
-        y_per = 1 - (1 - x_per) ** 3
-    elif inter_func == "inverse_cubic":
-        # https://www.wolframalpha.com/input/?i=1-(1-x)%5E(1%2F3)+from+0+to+1
-        y_per = 1 - (1 - x_per) ** (1 / 3)
-    else:
-        raise ValueError(
-            "unsupported inter_func given of {} in interpolate".format(inter_func)
-        )
+    y_per = kernel(x_per)
 
     if y_per <= 0.0 + sys.float_info.epsilon:
         return y0
@@ -282,18 +368,11 @@ def interpolated_integral(measurements: List[Tuple[float, float]]):
         return measurements[0][1]
 
     measurements.sort(key=lambda v: v[0])
-    integral = 0.0
+    x_vals, y_vals = numpy.asarray(measurements, dtype=numpy.float64).T
+    # trapezoidal rule over all intervals at once
+    integral = numpy.sum((y_vals[1:] + y_vals[:-1]) * numpy.diff(x_vals)) / 2.0
 
-    for index, (x_val, y_val) in enumerate(measurements):
-        if index >= len(measurements) - 1:
-            continue
-
-        x_next, y_next = measurements[index + 1]
-        x_dist = x_next - x_val
-        area = y_val * x_dist + (y_next - y_val) * x_dist / 2.0
-        integral += area
-
-    return integral
+    return integral.item()
 
 
 def clean_path(path: str) -> str:
@@ -301,23 +380,24 @@ def clean_path(path: str) -> str:
     :param path: the directory or file path to clean
     :return: a cleaned version that expands the user path and creates an absolute path
     """
+    if os.path.isabs(path):
+        # absolute paths don't depend on the cwd or home dir, so are safe to cache
+        return _clean_abs_path(path)
+
     return os.path.abspath(os.path.expanduser(path))
 
 
+@functools.lru_cache(maxsize=4096)
+def _clean_abs_path(path: str) -> str:
+    return os.path.abspath(path)
+
+
 def create_dirs(path: str):
     """
     :param path: the directory path to try and create
     """
     path = clean_path(path)
-
-    try:
-        os.makedirs(path)
-    except OSError as e:
-        if e.errno == errno.EEXIST:
-            pass
-        else:
-            # Unexpected OSError, re-raise.
-            raise
+    os.makedirs(path, exist_ok=True)
 
 
 def create_parent_dirs(path: str):
@@ -335,12 +415,18 @@ def create_unique_dir(path: str, check_number: int = 0) -> str:
     :param check_number: the number to begin checking for unique versions at
     :return: the unique directory path
     """
-    check_path = clean_path("{}-{:04d}".format(path, check_number))
+    parent, prefix = os.path.split(clean_path("{}-".format(path)))
+    # list the parent once instead of checking each numbered path separately
+    existing = (
+        {entry.name for entry in os.scandir(parent) if entry.name.startswith(prefix)}
+        if os.path.isdir(parent)
+        else set()
+    )
 
-    if not os.path.exists(check_path):
-        return check_path
+    while "{}{:04d}".format(prefix, check_number) in existing:
+        check_number += 1
 
-    return create_unique_dir(path, check_number + 1)
+    return os.path.join(parent, "{}{:04d}".format(prefix, check_number))
 
 
 def path_file_count(path: str, pattern: str = "*") -> int:
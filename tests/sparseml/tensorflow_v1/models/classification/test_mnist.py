@@ -45,6 +45,142 @@ def test_mnist():
             assert out.sum() != 0
 
 
+@pytest.mark.skipif(
+    os.getenv("NM_ML_SKIP_TENSORFLOW_TESTS", False),
+    reason="Skipping tensorflow_v1 tests",
+)
+@pytest.mark.skipif(
+    os.getenv("NM_ML_SKIP_MODEL_TESTS", False),
+    reason="Skipping model tests",
+)
+def test_mnist_variables():
+    with tf_compat.Graph().as_default():
+        inputs = tf_compat.placeholder(
+            tf_compat.float32, [None, 28, 28, 1], name="inputs"
+        )
+        mnist_net(inputs)
+        var_names = sorted(var.op.name for var in tf_compat.global_variables())
+        expected_names = sorted(
+            [
+                "mnist_net/blocks/conv{}/{}".format(index, name)
+                for index in range(4)
+                for name in ["weight", "bias"]
+            ]
+            + ["mnist_net/classifier/fc/weight", "mnist_net/classifier/fc/bias"]
+        )
+        assert var_names == expected_names
+
+
+@pytest.mark.skipif(
+    os.getenv("NM_ML_SKIP_TENSORFLOW_TESTS", False),
+    reason="Skipping tensorflow_v1 tests",
+)
+@pytest.mark.skipif(
+    os.getenv("NM_ML_SKIP_MODEL_TESTS", False),
+    reason="Skipping model tests",
+)
+def test_mnist_quantize():
+    with tf_compat.Graph().as_default() as graph:
+        inputs = tf_compat.placeholder(
+            tf_compat.float32, [None, 28, 28, 1], name="inputs"
+        )
+        logits = mnist_net(inputs, quantize=True)
+
+        for index in range(4):
+            scope = "mnist_net/blocks/conv{}".format(index)
+            assert graph.get_operation_by_name("{}/weight_quant".format(scope))
+            assert graph.get_operation_by_name("{}/act_quant".format(scope))
+
+        var_names = [var.op.name for var in tf_compat.global_variables()]
+
+        for index in range(4):
+            scope = "mnist_net/blocks/conv{}".format(index)
+            assert "{}/act_min".format(scope) in var_names
+            assert "{}/act_max".format(scope) in var_names
+
+        with tf_compat.Session() as sess:
+            sess.run(tf_compat.global_variables_initializer())
+            out = sess.run(
+                logits, feed_dict={inputs: numpy.random.random((1, 28, 28, 1))}
+            )
+            assert out.sum() != 0
+
+
+@pytest.mark.skipif(
+    os.getenv("NM_ML_SKIP_TENSORFLOW_TESTS", False),
+    reason="Skipping tensorflow_v1 tests",
+)
+@pytest.mark.skipif(
+    os.getenv("NM_ML_SKIP_MODEL_TESTS", False),
+    reason="Skipping model tests",
+)
+def test_mnist_quantize_restore(tmp_path):
+    checkpoint_path = os.path.join(str(tmp_path), "model.ckpt")
+
+    with tf_compat.Graph().as_default():
+        inputs = tf_compat.placeholder(
+            tf_compat.float32, [None, 28, 28, 1], name="inputs"
+        )
+        ModelRegistry.create("mnistnet", inputs)
+        saver = ModelRegistry.saver("mnistnet")
+
+        with tf_compat.Session() as sess:
+            sess.run(tf_compat.global_variables_initializer())
+            saver.save(sess, checkpoint_path)
+
+    with tf_compat.Graph().as_default():
+        inputs = tf_compat.placeholder(
+            tf_compat.float32, [None, 28, 28, 1], name="inputs"
+        )
+        logits = ModelRegistry.create("mnistnet", inputs, quantize=True)
+        saver = ModelRegistry.saver("mnistnet")
+
+        with tf_compat.Session() as sess:
+            sess.run(tf_compat.global_variables_initializer())
+            # fails if the saver includes the quantization range variables
+            saver.restore(sess, checkpoint_path)
+            out = sess.run(
+                logits, feed_dict={inputs: numpy.random.random((1, 28, 28, 1))}
+            )
+            assert out.sum() != 0
+
+
+@pytest.mark.skipif(
+    os.getenv("NM_ML_SKIP_TENSORFLOW_TESTS", False),
+    reason="Skipping tensorflow_v1 tests",
+)
+@pytest.mark.skipif(
+    os.getenv("NM_ML_SKIP_MODEL_TESTS", False),
+    reason="Skipping model tests",
+)
+def test_mnist_channels_first():
+    # channels_first convs need a GPU to run, so only check graph construction
+    with tf_compat.Graph().as_default():
+        inputs = tf_compat.placeholder(
+            tf_compat.float32, [None, 1, 28, 28], name="inputs"
+        )
+        logits = mnist_net(inputs, num_classes=10, data_format="channels_first")
+        assert logits.shape.as_list() == [None, 10]
+
+
+@pytest.mark.skipif(
+    os.getenv("NM_ML_SKIP_TENSORFLOW_TESTS", False),
+    reason="Skipping tensorflow_v1 tests",
+)
+@pytest.mark.skipif(
+    os.getenv("NM_ML_SKIP_MODEL_TESTS", False),
+    reason="Skipping model tests",
+)
+def test_mnist_data_format_negative():
+    with tf_compat.Graph().as_default():
+        inputs = tf_compat.placeholder(
+            tf_compat.float32, [None, 28, 28, 1], name="inputs"
+        )
+
+        with pytest.raises(ValueError):
+            mnist_net(inputs, data_format="NHWC")
+
+
 @pytest.mark.skipif(
     os.getenv("NM_ML_SKIP_TENSORFLOW_TESTS", False),
     reason="Skipping tensorflow_v1 tests",
@@ -12,13 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
+import numpy
 import pytest
 
 from sparseml.utils import (
     ALL_TOKEN,
+    bucket_iterable,
     convert_to_bool,
+    create_unique_dir,
     flatten_iterable,
     interpolate,
+    interpolated_integral,
     load_recipe_yaml_str,
     validate_str_iterable,
 )
@@ -31,6 +37,7 @@ from sparseml.utils import (
         ([0, 1], [0, 1]),
         ([[0, 1], [2, 3]], [0, 1, 2, 3]),
         ([[0, 1], 2, 3], [0, 1, 2, 3]),
+        ([[0, [1, [2, "str"]]], (3,), []], [0, 1, 2, "str", 3]),
     ],
 )
 def test_flatten_iterable(test_list, output):
@@ -55,6 +62,11 @@ def test_flatten_iterable(test_list, output):
         ("False", False),
         (0, False),
         ("0", False),
+        (" no ", False),
+        ("off", False),
+        ("", False),
+        ("offer", True),
+        ("10", True),
     ],
 )
 def test_convert_to_bool(test_bool, output):
@@ -82,6 +94,39 @@ def test_validate_str_iterable_negative():
         validate_str_iterable("will fail", "")
 
 
+@pytest.mark.parametrize(
+    "val,num_buckets,edge_percent,sort_highest,output",
+    [
+        ([], 3, 0.05, True, []),
+        (
+            [0, 1, 2, 3, 4, 5],
+            3,
+            0.0,
+            True,
+            [(0, 5), (0, 4), (1, 3), (1, 2), (2, 1), (2, 0)],
+        ),
+        ([3, 1, 2, 0, 4], 2, 0.2, False, [(-1, 0), (0, 1), (0, 2), (1, 3), (1, 4)]),
+        ([1, 2, 3], 2, 2.0, True, [(-1, 3), (-1, 2), (-1, 1)]),
+        (
+            [0, 1, 2, 3, 4, 5, 6],
+            3,
+            0.0,
+            False,
+            [(0, 0), (0, 1), (1, 2), (1, 3), (2, 4), (2, 5), (2, 6)],
+        ),
+    ],
+)
+def test_bucket_iterable(val, num_buckets, edge_percent, sort_highest, output):
+    bucketed = bucket_iterable(val, num_buckets, edge_percent, sort_highest)
+    assert bucketed == output
+
+    sorted_vals, bucket_ids = bucket_iterable(
+        val, num_buckets, edge_percent, sort_highest, as_array=True
+    )
+    assert bucket_ids.dtype == numpy.int32
+    assert list(zip(bucket_ids.tolist(), sorted_vals)) == output
+
+
 @pytest.mark.parametrize(
     "x_cur,x0,x1,y0,y1,inter_func,out",
     [
@@ -94,6 +139,12 @@ def test_validate_str_iterable_negative():
         (0.5, 0.0, 1.0, 0.0, 5.0, "linear", 2.5),
         (0.5, 0.0, 1.0, 0.0, 5.0, "cubic", 4.375),
         (0.5, 0.0, 1.0, 0.0, 5.0, "inverse_cubic", 1.031),
+        (-1.0, 0.0, 1.0, 0.0, 5.0, "linear", 0.0),
+        (-1.0, 0.0, 1.0, 0.0, 5.0, "cubic", 0.0),
+        (-1.0, 0.0, 1.0, 0.0, 5.0, "inverse_cubic", 0.0),
+        (12.0, 0.0, 10.0, 0.0, 5.0, "linear", 5.0),
+        (12.0, 0.0, 10.0, 0.0, 5.0, "cubic", 5.0),
+        (12.0, 0.0, 10.0, 0.0, 5.0, "inverse_cubic", 5.0),
     ],
 )
 def test_interpolate(x_cur, x0, x1, y0, y1, inter_func, out):
@@ -101,6 +152,31 @@ def test_interpolate(x_cur, x0, x1, y0, y1, inter_func, out):
     assert abs(out - interpolated) < 0.01
 
 
+@pytest.mark.parametrize(
+    "measurements,out",
+    [
+        ([], 0.0),
+        ([(0.0, 4.0)], 4.0),
+        ([(0.0, 0.0), (1.0, 2.0)], 1.0),
+        ([(3.0, 1.0), (0.0, 0.0), (1.0, 2.0)], 4.0),
+    ],
+)
+def test_interpolated_integral(measurements, out):
+    integral = interpolated_integral(measurements)
+    assert abs(out - integral) < 1e-6
+
+
+def test_create_unique_dir(tmp_path):
+    base = os.path.join(str(tmp_path), "run")
+    assert create_unique_dir(base) == "{}-0000".format(base)
+
+    for number in [0, 1, 3]:
+        os.makedirs("{}-{:04d}".format(base, number))
+
+    assert create_unique_dir(base) == "{}-0002".format(base)
+    assert create_unique_dir(base, check_number=3) == "{}-0004".format(base)
+
+
 @pytest.mark.parametrize(
     "zoo_path",
     [